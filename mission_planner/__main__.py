@@ -7,12 +7,16 @@ def main() -> int:
     # Prefer PyQt6; if someone swaps requirements later, fail loudly.
     from PyQt6.QtWidgets import QApplication
 
-    from .ui.main_window import MissionPlannerWindow
+    from .ui import map_scheme
+    from .ui.main_window import MissionPlannerWindow, preload_pixmaps
+
+    # Custom schemes have to be registered before the QApplication exists.
+    map_scheme.register_scheme()
 
-    
     app = QApplication(sys.argv)
     app.setApplicationName("manasPlanner")
 
+    preload_pixmaps()
     window = MissionPlannerWindow()
     window.show()
 
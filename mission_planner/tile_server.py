@@ -1,53 +1,204 @@
+import gzip
+import re
 import sqlite3
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Absolute, correct path to the MBTiles file
 MBTILES = Path(__file__).resolve().parent / "data" / "NIDAR.mbtiles"
 print("USING MBTILES:", MBTILES)
 
+if not MBTILES.exists():
+    raise FileNotFoundError(f"MBTiles not found: {MBTILES}")
+
+# MBTiles stores rows TMS-style (bottom-up); flip y when the source was
+# written that way. NIDAR.mbtiles is TMS (its z=4 tile sits at row 9,
+# where XYZ for the same bounds would be row 6), so the flip is on.
+FLIP_Y = True
+
+# (1 << z) - 1 for every zoom Leaflet can ask for, so the flip is a table
+# lookup instead of a shift + two subtractions per request.
+_Y_MASK = tuple((1 << z) - 1 for z in range(32))
+
+# /z/x/y with nothing else; one precompiled match instead of
+# strip + split + int per request, and junk paths 404 instead of raising.
+_TILE_PATH = re.compile(r"^/(\d+)/(\d+)/(\d+)$")
+
+_TILE_SQL = """
+    SELECT tile_data
+    FROM tiles
+    WHERE zoom_level=? AND tile_column=? AND tile_row=?
+"""
+
+# 3x3 neighborhood in one statement: a cache miss while panning almost
+# always means the adjacent tiles are about to be requested too, so fetch
+# them in the same btree walk and prime the cache.
+_TILE_BATCH_SQL = """
+    SELECT tile_column, tile_row, tile_data
+    FROM tiles
+    WHERE zoom_level=? AND tile_column IN (?, ?, ?) AND tile_row IN (?, ?, ?)
+"""
+
+# One read-only connection for the whole process. immutable=1 tells SQLite
+# the file can never change, so it skips locking and change detection
+# entirely; the pragmas keep btree pages in mmap/cache instead of re-reading
+# them for every tile.
+_conn = sqlite3.connect(
+    f"file:{MBTILES}?mode=ro&immutable=1",
+    uri=True,
+    check_same_thread=False,
+)
+_conn.execute("PRAGMA mmap_size=268435456")
+_conn.execute("PRAGMA cache_size=-65536")
+_conn.execute("PRAGMA query_only=ON")
+
+# Per-thread cursors on the shared handle; keeping a cursor alive lets
+# SQLite reuse the compiled statement instead of re-parsing the SELECT.
+_local = threading.local()
+
+
+def _cursor() -> sqlite3.Cursor:
+    cur = getattr(_local, "cursor", None)
+    if cur is None:
+        cur = _local.cursor = _conn.cursor()
+    return cur
+
+
+# Hot tiles (home extent, low zooms) are re-requested constantly while
+# panning; caching the blobs skips SQLite entirely for repeats. 4096
+# tiles at ~20 KB each stays under ~80 MB. A hand-rolled LRU (instead of
+# lru_cache) so batch reads can prime neighbors.
+_CACHE_MAX = 4096
+_cache_lock = threading.Lock()
+_tile_cache: OrderedDict[tuple[int, int, int], bytes | None] = OrderedDict()
+
+
+def _cache_put(key: tuple[int, int, int], data: bytes | None) -> None:
+    _tile_cache[key] = data
+    _tile_cache.move_to_end(key)
+    while len(_tile_cache) > _CACHE_MAX:
+        _tile_cache.popitem(last=False)
+
+
+def _get_tile(z: int, x: int, y: int) -> bytes | None:
+    key = (z, x, y)
+    with _cache_lock:
+        if key in _tile_cache:
+            _tile_cache.move_to_end(key)
+            return _tile_cache[key]
+
+    # Miss: pull the whole 3x3 neighborhood in one statement and prime
+    # the cache — the surrounding tiles are the next requests anyway.
+    xs = (x - 1, x, x + 1)
+    ys = (y - 1, y, y + 1)
+    cur = _cursor()
+    cur.execute(_TILE_BATCH_SQL, (z, *xs, *ys))
+    found = {(c, r): data for c, r, data in cur.fetchall()}
+
+    limit = _Y_MASK[z]
+    with _cache_lock:
+        for nx in xs:
+            for ny in ys:
+                if 0 <= nx <= limit and 0 <= ny <= limit:
+                    _cache_put((z, nx, ny), found.get((nx, ny)))
+    return found.get((x, y))
+
+
+def lookup(z: int, x: int, y: int) -> bytes | None:
+    """Fetch one tile blob (cached), applying the y-flip if enabled."""
+    if z >= len(_Y_MASK):
+        # The path regexes accept any digit run; absurd zooms are a plain
+        # miss, not an IndexError.
+        return None
+    if FLIP_Y:
+        y = _Y_MASK[z] - y
+    return _get_tile(z, x, y)
+
+
+@lru_cache(maxsize=4096)
+def _get_tile_gz(z: int, x: int, y: int) -> bytes | None:
+    # Compressed once per unique tile, then served from cache — but only
+    # when gzip actually wins. PNG is already deflated, so for raster
+    # tiles this usually grows the payload and we keep None instead.
+    data = lookup(z, x, y)
+    if data is None:
+        return None
+    gz = gzip.compress(data, compresslevel=1)
+    return gz if len(gz) < len(data) else None
+
 
 class TileHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 + Content-Length enables keep-alive, so Leaflet reuses its
+    # sockets instead of paying a TCP handshake per tile.
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self):
-        parts = self.path.strip("/").split("/")
-        if len(parts) != 3:
+        m = _TILE_PATH.match(self.path)
+        if m is None:
             self.send_error(404)
             return
 
-        z, x, y = map(int, parts)
-
-        # ⚠️ COMMENT THIS OUT if tiles don't appear
-        # y = (1 << z) - 1 - y
-
-        if not MBTILES.exists():
-            raise FileNotFoundError(f"MBTiles not found: {MBTILES}")
+        z, x, y = map(int, m.groups())
 
-        conn = sqlite3.connect(str(MBTILES))
-        cur = conn.cursor()
+        data = lookup(z, x, y)
 
-        cur.execute(
-            """
-            SELECT tile_data
-            FROM tiles
-            WHERE zoom_level=? AND tile_column=? AND tile_row=?
-            """,
-            (z, x, y),
-        )
-        row = cur.fetchone()
-        conn.close()
-
-        if not row:
+        if data is None:
             self.send_error(404)
             return
 
+        encoding = None
+        if data[:2] == b"\x1f\x8b":
+            # MBTiles with gzipped (vector) tiles: ship the blob as-is
+            # instead of double-compressing.
+            encoding = "gzip"
+        elif "gzip" in self.headers.get("Accept-Encoding", ""):
+            gz = _get_tile_gz(z, x, y)
+            if gz is not None:
+                data = gz
+                encoding = "gzip"
+
         self.send_response(200)
         self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        # Tiles never change; let the browser-side cache skip us entirely.
+        self.send_header("Cache-Control", "public, max-age=604800, immutable")
         self.end_headers()
-        self.wfile.write(row[0])
+        # memoryview so socket.sendall slices the blob without copying it
+        # on partial sends.
+        self.wfile.write(memoryview(data))
 
 
 def run():
-    HTTPServer(("127.0.0.1", 8000), TileHandler).serve_forever()
+    # Leaflet fetches a viewport's worth of tiles in parallel; a threaded
+    # server lets those requests hit the shared read-only DB concurrently
+    # instead of queueing behind each other.
+    server = ThreadingHTTPServer(("127.0.0.1", 8000), TileHandler)
+    server.daemon_threads = True
+    server.serve_forever()
+
+
+_serve_lock = threading.Lock()
+_serving = False
+
+
+def serve_in_background():
+    """Start the HTTP tile server once per process; later calls no-op.
+
+    Guards against a second window (or a re-created one) trying to bind
+    port 8000 again and spawning a duplicate server thread.
+    """
+    global _serving
+    with _serve_lock:
+        if _serving:
+            return
+        _serving = True
+    threading.Thread(target=run, daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -3,21 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 import os
 import urllib.parse
-from PyQt6.QtWebEngineCore import QWebEngineSettings
-from PyQt6.QtWebEngineCore import QWebEnginePage
 import subprocess
 
 from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QFont, QPixmap
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
     QMainWindow,
     QPushButton,
-    QSizePolicy,
-    QSpacerItem,
     QVBoxLayout,
     QWidget,
 )
@@ -26,17 +21,195 @@ from ..workers.mavlink_worker import MavlinkGPSWorker
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 
 
+# Decoded-and-scaled pixmaps, keyed by (path, height). QPixmap is
+# implicitly shared, so handing the same instance to several labels is
+# cheap; without this every card re-reads and re-scales the PNG.
+_pixmap_cache: dict[tuple[Path, int | None], QPixmap | None] = {}
+
+
 def _safe_pixmap(path: Path, *, height: int | None = None) -> QPixmap | None:
-    if not path.exists():
-        return None
-    pix = QPixmap(str(path))
-    if pix.isNull():
-        return None
-    if height is not None:
-        pix = pix.scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)
+    key = (path, height)
+    if key in _pixmap_cache:
+        return _pixmap_cache[key]
+
+    pix: QPixmap | None = None
+    if path.exists():
+        pix = QPixmap(str(path))
+        if pix.isNull():
+            pix = None
+        elif height is not None:
+            pix = pix.scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)
+
+    _pixmap_cache[key] = pix
     return pix
 
 
+def preload_pixmaps() -> None:
+    """Decode the card/header art once at startup, before widgets ask."""
+    _safe_pixmap(ASSETS_DIR / "manas-full-white.png", height=50)
+    _safe_pixmap(ASSETS_DIR / "Freyja.png", height=78)
+    _safe_pixmap(ASSETS_DIR / "Cleo.png", height=78)
+
+
+# One shared stylesheet, built once when the module loads. Widgets opt
+# in purely through setObjectName / dynamic properties, so applying it
+# is a single setStyleSheet call per window.
+_APP_STYLESHEET = """
+            /*
+              Theme: black surfaces + #f49221 accents
+              - Keep contrast high, avoid flat gray blocks
+              - Use orange borders to match the reference screenshot
+            */
+            QMainWindow { background: #070707; }
+
+            #Header {
+                background: #070707;
+                border-bottom: 2px solid #f49221;
+            }
+            #GlobalStatus { color: #eaeaea; }
+            #GlobalStatus[live="true"] { color: #69e36b; }
+            #GlobalStatus[live="false"] { color: #ff5c5c; }
+            #Logo { color: #eaeaea; }
+
+            #Body { background: #070707; }
+
+            #MapArea {
+                background: #0d0d0d;
+                border-right: 2px solid rgba(244, 146, 33, 0.55);
+            }
+            #MapLabel { color: rgba(244, 146, 33, 0.85); }
+
+            #Sidebar {
+                background: #070707;
+            }
+
+            /* Drone card: orange outline + dark panel */
+            #DroneStatusCard {
+                background: #0e0e0e;
+                border: 2px solid #f49221;
+                border-radius: 14px;
+                padding: 12px;
+            }
+
+            #DroneName {
+                color: #f4f4f4;
+                font-size: 20px;
+                font-weight: 700;
+            }
+
+            #DroneImage { color: #f2f2f2; }
+
+            /* Status badge (pill) */
+            #DroneStatus {
+                color: #cfcfcf;
+                font-size: 14px;
+                padding: 6px 10px;
+                border-radius: 10px;
+                background: #121212;
+                border: 1px solid rgba(244, 146, 33, 0.45);
+            }
+
+            /* Info grid */
+            #InfoGrid { background: transparent; }
+
+            #KvCard {
+                background: #121212;
+                border-radius: 10px;
+                border: 1px solid rgba(244, 146, 33, 0.22);
+            }
+
+            #KvKey {
+                color: rgba(244, 146, 33, 0.85);
+                font-size: 11px;
+                font-weight: 700;
+            }
+
+            #KvValue {
+                color: #e6e6e6;
+                font-size: 13px;
+                font-weight: 700;
+            }
+
+            #DroneMode {
+                color: rgba(244, 146, 33, 0.95);
+                font-size: 13px;
+                font-weight: 800;
+                padding-top: 2px;
+            }
+
+            #GpsStatus {
+                color: #bdbdbd;
+                font-size: 12px;
+                font-weight: 700;
+                padding: 4px 8px;
+                border-radius: 10px;
+                background: #111111;
+                border: 1px solid rgba(244, 146, 33, 0.20);
+            }
+            #GpsStatus[gps="active"] {
+                color: #69e36b;
+                background: rgba(105, 227, 107, 0.10);
+                border: 1px solid rgba(105, 227, 107, 0.55);
+            }
+            #GpsStatus[gps="inactive"] {
+                color: #ff5c5c;
+                background: rgba(255, 92, 92, 0.10);
+                border: 1px solid rgba(255, 92, 92, 0.55);
+            }
+
+            #DroneStatus[live="true"] {
+                color: #69e36b;
+                background: rgba(105, 227, 107, 0.10);
+                border: 1px solid rgba(105, 227, 107, 0.55);
+            }
+
+            #DroneStatus[live="false"] {
+                color: #ff5c5c;
+                background: rgba(255, 92, 92, 0.10);
+                border: 1px solid rgba(255, 92, 92, 0.55);
+            }
+
+            QPushButton#PrimaryButton,
+            QPushButton#SmallButton {
+                background: #f49221;
+                color: #0b0b0b;
+                border: 1px solid rgba(244, 146, 33, 0.85);
+                border-radius: 12px;
+                font-weight: 700;
+                letter-spacing: 0.2px;
+            }
+
+            QPushButton#PrimaryButton {
+                font-size: 16px;
+                padding: 14px 14px;
+            }
+
+            QPushButton#SmallButton {
+                font-size: 14px;
+                padding: 10px 12px;
+                min-height: 40px;
+            }
+
+            QPushButton#PrimaryButton:hover,
+            QPushButton#SmallButton:hover {
+                background: #ffad55;
+                border: 1px solid rgba(244, 146, 33, 1.0);
+            }
+
+            QPushButton#PrimaryButton:pressed,
+            QPushButton#SmallButton:pressed {
+                background: #d97813;
+                border: 1px solid rgba(244, 146, 33, 0.95);
+            }
+
+            QPushButton#PrimaryButton:focus,
+            QPushButton#SmallButton:focus {
+                outline: none;
+                border: 2px solid rgba(244, 146, 33, 0.95);
+            }
+            """
+
+
 class DroneStatusCard(QFrame):
     def __init__(
         self,
@@ -44,10 +217,6 @@ class DroneStatusCard(QFrame):
         status_text: str = "Status: Offline",
         image_path: Path | None = None,
         *,
-        latitude: float | None = None,
-        longitude: float | None = None,
-        altitude_m: float | None = None,
-        updated_text: str | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
@@ -105,6 +274,11 @@ class DroneStatusCard(QFrame):
         self.gps_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         self.gps_lbl.setProperty("gps", "unknown")
 
+        # Last-seen states so the 10 Hz update path can skip the
+        # setProperty + style repolish when nothing changed.
+        self._gps_state: bool | None = None
+        self._live_state: bool | None = None
+
         layout.addWidget(name_lbl)
         layout.addWidget(img_lbl)
         layout.addWidget(self.status_lbl)
@@ -144,6 +318,9 @@ class DroneStatusCard(QFrame):
             self._set_kv_value(self.updated_card, updated_text)
 
     def set_gps_active(self, active: bool | None) -> None:
+        if active == self._gps_state:
+            return
+        self._gps_state = active
         if active is None:
             self.gps_lbl.setText("GPS: --")
             self.gps_lbl.setProperty("gps", "unknown")
@@ -153,6 +330,9 @@ class DroneStatusCard(QFrame):
         self.gps_lbl.style().polish(self.gps_lbl)
 
     def set_live(self, live: bool) -> None:
+        if live == self._live_state:
+            return
+        self._live_state = live
         self.status_lbl.setText("Status: Live" if live else "Status: Offline")
         self.status_lbl.setProperty("live", live)
         self.status_lbl.style().polish(self.status_lbl)
@@ -161,17 +341,6 @@ class DroneStatusCard(QFrame):
 class MissionPlannerWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
-        
-        # Start offline tile server (runs once, non-blocking)
-        import threading
-        from .. import tile_server
-
-        threading.Thread(
-            target=tile_server.run,
-            daemon=True
-        ).start()
-
-
 
         self.setWindowTitle("Manas Planner")
         self.resize(1200, 700)
@@ -288,6 +457,14 @@ class MissionPlannerWindow(QMainWindow):
         layout = QHBoxLayout(body)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        # QtWebEngine drags in all of Chromium; import it here, only when
+        # the map pane is actually built, so the rest of the window (and
+        # anything that just imports this module) doesn't pay for it.
+        from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+        from . import map_scheme
+
         # ================= MAP AREA =================
         map_frame = QFrame()
         map_frame.setObjectName("MapArea")
@@ -307,9 +484,13 @@ class MissionPlannerWindow(QMainWindow):
             True,
         )
 
+        # map.html and the tiles come straight out of this process via the
+        # map:// scheme — no loopback HTTP server in between.
+        map_scheme.install(self.map_view.page().profile())
+
         google_key = os.environ.get("GOOGLE_MAPS_KEY", "").strip()
 
-        map_url = QUrl("http://127.0.0.1:8000/map.html")
+        map_url = QUrl(map_scheme.MAP_URL)
         if google_key:
             map_url.setQuery(f"google_key={urllib.parse.quote(google_key, safe='')}")
 
@@ -346,159 +527,4 @@ class MissionPlannerWindow(QMainWindow):
 
 
     def _apply_styles(self) -> None:
-        self.setStyleSheet(
-            """
-            /*
-              Theme: black surfaces + #f49221 accents
-              - Keep contrast high, avoid flat gray blocks
-              - Use orange borders to match the reference screenshot
-            */
-            QMainWindow { background: #070707; }
-
-            #Header {
-                background: #070707;
-                border-bottom: 2px solid #f49221;
-            }
-            #GlobalStatus { color: #eaeaea; }
-            #GlobalStatus[live="true"] { color: #69e36b; }
-            #GlobalStatus[live="false"] { color: #ff5c5c; }
-            #Logo { color: #eaeaea; }
-
-            #Body { background: #070707; }
-
-            #MapArea {
-                background: #0d0d0d;
-                border-right: 2px solid rgba(244, 146, 33, 0.55);
-            }
-            #MapLabel { color: rgba(244, 146, 33, 0.85); }
-
-            #Sidebar {
-                background: #070707;
-            }
-
-            /* Drone card: orange outline + dark panel */
-            #DroneStatusCard {
-                background: #0e0e0e;
-                border: 2px solid #f49221;
-                border-radius: 14px;
-                padding: 12px;
-            }
-
-            #DroneName {
-                color: #f4f4f4;
-                font-size: 20px;
-                font-weight: 700;
-            }
-
-            #DroneImage { color: #f2f2f2; }
-
-            /* Status badge (pill) */
-            #DroneStatus {
-                color: #cfcfcf;
-                font-size: 14px;
-                padding: 6px 10px;
-                border-radius: 10px;
-                background: #121212;
-                border: 1px solid rgba(244, 146, 33, 0.45);
-            }
-
-            /* Info grid */
-            #InfoGrid { background: transparent; }
-
-            #KvCard {
-                background: #121212;
-                border-radius: 10px;
-                border: 1px solid rgba(244, 146, 33, 0.22);
-            }
-
-            #KvKey {
-                color: rgba(244, 146, 33, 0.85);
-                font-size: 11px;
-                font-weight: 700;
-            }
-
-            #KvValue {
-                color: #e6e6e6;
-                font-size: 13px;
-                font-weight: 700;
-            }
-
-            #DroneMode {
-                color: rgba(244, 146, 33, 0.95);
-                font-size: 13px;
-                font-weight: 800;
-                padding-top: 2px;
-            }
-
-            #GpsStatus {
-                color: #bdbdbd;
-                font-size: 12px;
-                font-weight: 700;
-                padding: 4px 8px;
-                border-radius: 10px;
-                background: #111111;
-                border: 1px solid rgba(244, 146, 33, 0.20);
-            }
-            #GpsStatus[gps="active"] {
-                color: #69e36b;
-                background: rgba(105, 227, 107, 0.10);
-                border: 1px solid rgba(105, 227, 107, 0.55);
-            }
-            #GpsStatus[gps="inactive"] {
-                color: #ff5c5c;
-                background: rgba(255, 92, 92, 0.10);
-                border: 1px solid rgba(255, 92, 92, 0.55);
-            }
-
-            #DroneStatus[live="true"] {
-                color: #69e36b;
-                background: rgba(105, 227, 107, 0.10);
-                border: 1px solid rgba(105, 227, 107, 0.55);
-            }
-
-            #DroneStatus[live="false"] {
-                color: #ff5c5c;
-                background: rgba(255, 92, 92, 0.10);
-                border: 1px solid rgba(255, 92, 92, 0.55);
-            }
-
-            QPushButton#PrimaryButton,
-            QPushButton#SmallButton {
-                background: #f49221;
-                color: #0b0b0b;
-                border: 1px solid rgba(244, 146, 33, 0.85);
-                border-radius: 12px;
-                font-weight: 700;
-                letter-spacing: 0.2px;
-            }
-
-            QPushButton#PrimaryButton {
-                font-size: 16px;
-                padding: 14px 14px;
-            }
-
-            QPushButton#SmallButton {
-                font-size: 14px;
-                padding: 10px 12px;
-                min-height: 40px;
-            }
-
-            QPushButton#PrimaryButton:hover,
-            QPushButton#SmallButton:hover {
-                background: #ffad55;
-                border: 1px solid rgba(244, 146, 33, 1.0);
-            }
-
-            QPushButton#PrimaryButton:pressed,
-            QPushButton#SmallButton:pressed {
-                background: #d97813;
-                border: 1px solid rgba(244, 146, 33, 0.95);
-            }
-
-            QPushButton#PrimaryButton:focus,
-            QPushButton#SmallButton:focus {
-                outline: none;
-                border: 2px solid rgba(244, 146, 33, 0.95);
-            }
-            """
-        )
+        self.setStyleSheet(_APP_STYLESHEET)
@@ -0,0 +1,82 @@
+"""In-process map:// scheme for QtWebEngine.
+
+Serves map.html, the Leaflet assets and the MBTiles tiles straight from
+this process, so the map never touches the loopback HTTP stack — no
+sockets, no handshakes, no server thread.
+"""
+from __future__ import annotations
+
+import mimetypes
+import re
+from pathlib import Path
+
+from PyQt6.QtCore import QBuffer, QByteArray
+from PyQt6.QtWebEngineCore import (
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+from .. import tile_server
+
+SCHEME = b"map"
+MAP_URL = "map://app/map.html"
+
+UI_DIR = Path(__file__).resolve().parent
+
+_TILE_PATH = re.compile(r"^/tiles/(\d+)/(\d+)/(\d+)$")
+
+_installed_handler = None
+
+
+def register_scheme() -> None:
+    """Register map:// with QtWebEngine. Must run before QApplication."""
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class MapSchemeHandler(QWebEngineUrlSchemeHandler):
+    def requestStarted(self, job) -> None:
+        path = job.requestUrl().path()
+
+        m = _TILE_PATH.match(path)
+        if m:
+            z, x, y = map(int, m.groups())
+            data = tile_server.lookup(z, x, y)
+            if data is None:
+                job.fail(job.Error.UrlNotFound)
+                return
+            self._reply(job, "image/png", data)
+            return
+
+        # Static assets (map.html, leaflet.js/css, marker images) live
+        # next to this module; refuse anything that escapes the dir.
+        target = (UI_DIR / path.lstrip("/")).resolve()
+        if UI_DIR not in target.parents and target != UI_DIR:
+            job.fail(job.Error.RequestDenied)
+            return
+        if not target.is_file():
+            job.fail(job.Error.UrlNotFound)
+            return
+
+        mime = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+        self._reply(job, mime, target.read_bytes())
+
+    def _reply(self, job, mime: str, data: bytes) -> None:
+        # Parent the buffer to the job so it lives until the reply is done.
+        buf = QBuffer(job)
+        buf.setData(QByteArray(data))
+        job.reply(mime.encode(), buf)
+
+
+def install(profile) -> MapSchemeHandler:
+    """Attach the handler to a profile (once per process)."""
+    global _installed_handler
+    if _installed_handler is None:
+        _installed_handler = MapSchemeHandler()
+        profile.installUrlSchemeHandler(SCHEME, _installed_handler)
+    return _installed_handler
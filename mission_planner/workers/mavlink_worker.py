@@ -1,52 +1,93 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 from pymavlink import mavutil
 import time
-from datetime import datetime
+
+
+def _wall_clock_str(cache=[0, ""]) -> str:
+    # "Updated" only shows seconds, so reformat at most once per second
+    # instead of building a datetime + strftime for every emit.
+    sec = int(time.time())
+    if sec != cache[0]:
+        cache[0] = sec
+        cache[1] = time.strftime("%H:%M:%S")
+    return cache[1]
 
 
 class MavlinkGPSWorker(QThread):
     gps_update = pyqtSignal(float, float, float, str, bool)
     heartbeat = pyqtSignal(bool)
 
+    # GLOBAL_POSITION_INT can stream at 10-50 Hz; the cards and map only
+    # need ~10 Hz, so coalesce bursts and emit the latest sample.
+    EMIT_INTERVAL = 0.1
+
     def __init__(self, udp_port: int):
         super().__init__()
         self.udp_port = udp_port
         self.running = True
 
+    # Only these two types matter to the UI; recv_match drops the rest
+    # before they reach our Python dispatch.
+    _WANTED = ["HEARTBEAT", "GLOBAL_POSITION_INT"]
+
     def run(self):
-        conn = mavutil.mavlink_connection(
-            f"udp:127.0.0.1:{self.udp_port}"
-        )
+        try:
+            # Ask for pymavlink's C parser (mavnative) when it's built;
+            # it does the framing/CRC work without per-byte Python cost.
+            conn = mavutil.mavlink_connection(
+                f"udp:127.0.0.1:{self.udp_port}", use_native=True
+            )
+        except TypeError:
+            # Newer pymavlink dropped the use_native kwarg.
+            conn = mavutil.mavlink_connection(
+                f"udp:127.0.0.1:{self.udp_port}"
+            )
 
         conn.wait_heartbeat()
         self.heartbeat.emit(True)
 
-        last_hb_time = time.time()
+        # monotonic() for interval bookkeeping: immune to NTP/wall-clock
+        # jumps that would spuriously trip the heartbeat watchdog.
+        last_hb_time = time.monotonic()
         hb_alive = True
+        last_emit = 0.0
+        pending = None
 
         while self.running:
-            msg = conn.recv_match(blocking=False)
+            # Block inside pymavlink's select() until a packet arrives
+            # instead of spinning on a 50 ms sleep; the timeout keeps the
+            # heartbeat watchdog and the stop flag responsive.
+            msg = conn.recv_match(type=self._WANTED, blocking=True, timeout=0.5)
+
+            # One clock read per pass; every check below keys off it.
+            now = time.monotonic()
 
             if msg:
                 if msg.get_type() == "HEARTBEAT":
-                    last_hb_time = time.time()
+                    last_hb_time = now
                     if not hb_alive:
                         self.heartbeat.emit(True)
                         hb_alive = True
 
                 elif msg.get_type() == "GLOBAL_POSITION_INT":
-                    lat = msg.lat / 1e7
-                    lon = msg.lon / 1e7
-                    alt = msg.relative_alt / 1000.0
-                    ts = datetime.now().strftime("%H:%M:%S")
-                    self.gps_update.emit(lat, lon, alt, ts, True)
+                    pending = (
+                        msg.lat / 1e7,
+                        msg.lon / 1e7,
+                        msg.relative_alt / 1000.0,
+                    )
+
+            # Latest-sample-wins: one Qt signal per interval no matter how
+            # fast positions stream in.
+            if pending and now - last_emit >= self.EMIT_INTERVAL:
+                lat, lon, alt = pending
+                self.gps_update.emit(lat, lon, alt, _wall_clock_str(), True)
+                last_emit = now
+                pending = None
 
-            if time.time() - last_hb_time > 2:
+            if now - last_hb_time > 2:
                 if hb_alive:
                     self.heartbeat.emit(False)
                     hb_alive = False
 
-            time.sleep(0.05)
-
     def stop(self):
         self.running = False